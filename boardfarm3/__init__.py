@@ -2,12 +2,39 @@
 
 __version__ = "1.0.1"
 
-from pluggy import HookimplMarker, HookspecMarker
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pluggy import HookimplMarker, HookspecMarker
+
+    hookspec: HookspecMarker
+    hookimpl: HookimplMarker
 
 PROJECT_NAME = "boardfarm"
 
-hookspec = HookspecMarker(PROJECT_NAME)
-hookimpl = HookimplMarker(PROJECT_NAME)
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Create the pluggy hook markers on first access.
+
+    Importing any boardfarm3 submodule runs this module, so the markers and
+    with them pluggy are only loaded once a hook is actually declared.
+
+    :param name: attribute name
+    :type name: str
+    :raises AttributeError: when the attribute is not a hook marker
+    :return: hook marker of the boardfarm project
+    :rtype: Any
+    """
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    # pylint: disable-next=import-outside-toplevel
+    from pluggy import HookimplMarker, HookspecMarker
+
+    marker_class = HookimplMarker if name == "hookimpl" else HookspecMarker
+    marker = marker_class(PROJECT_NAME)
+    globals()[name] = marker
+    return marker
 
 
 __all__ = ["hookimpl", "hookspec"]
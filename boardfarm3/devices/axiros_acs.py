@@ -36,6 +36,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 _DATE_LENGTH = 6
+# exact type match on purpose, bool must not be reported as int
+_SCALAR_TYPE_NAMES: dict[type, str] = {int: "int", str: "string", bool: "boolean"}
 _HTTP_OK = 200  # requests.codes & httpx._status_codes.codes make mypy unhappy
 
 
@@ -86,15 +88,11 @@ class AxirosACS(LinuxDevice, ACS):
     """
 
     @staticmethod
-    def _type_conversion(data: Any) -> str:  # noqa: ANN401, # pylint: disable=R0911
+    def _type_conversion(data: Any) -> str:  # noqa: ANN401
         # TODO: Currently a very simple conversion, maybe revisited!
         data_type = type(data)
-        if data_type is int:
-            return "int"
-        if data_type is str:
-            return "string"
-        if data_type is bool:
-            return "boolean"
+        if (type_name := _SCALAR_TYPE_NAMES.get(data_type)) is not None:
+            return type_name
         if data_type is list and len(data) == _DATE_LENGTH:  # very simple check ATM
             return "date"
         msg = f"Cannot detect type for {data}"
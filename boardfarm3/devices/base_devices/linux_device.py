@@ -30,7 +30,13 @@ from boardfarm3.exceptions import (
 from boardfarm3.lib.connection_factory import connection_factory
 from boardfarm3.lib.connections.local_cmd import LocalCmd
 from boardfarm3.lib.network_utils import NetworkUtility
-from boardfarm3.lib.networking import HTTPResult, dns_lookup, http_get, is_link_up
+from boardfarm3.lib.networking import (
+    BACKGROUND_JOB_PID_PATTERN,
+    HTTPResult,
+    dns_lookup,
+    http_get,
+    is_link_up,
+)
 from boardfarm3.lib.networking import start_tcpdump as start_dump
 from boardfarm3.lib.networking import stop_tcpdump as stop_dump
 from boardfarm3.lib.regexlib import AllValidIpv6AddressesRegex, LinuxMacFormat
@@ -85,9 +91,16 @@ class LinuxDevice(BoardfarmDevice):
     def _parse_device_suboptions(self) -> dict[str, str]:
         """Parse the sub-options provided in device config.
 
+        The options are parsed only once, the returned dictionary is shared
+        between the callers and must not be modified.
+
         :return: parsed sub-options
         :rtype: dict[str, str]
         """
+        return self._device_suboptions
+
+    @cached_property
+    def _device_suboptions(self) -> dict[str, str]:
         parsed_options: dict[str, str] = {}
 
         if "options" not in self._config:
@@ -108,44 +121,42 @@ class LinuxDevice(BoardfarmDevice):
 
         :raises ValueError: if the syntax is incorrect in inventory
         """
-        options = self._parse_device_suboptions()
-        for option, opt_val in options.items():
-            if option == "static-route":
-                for route_entry in opt_val.split(";"):
-                    try:
-                        destination, gateway = map(str.strip, route_entry.split("-"))
-                        await self._console.execute_command_async(
-                            f"ip route del {destination}"
-                        )
-                        await self._console.execute_command_async(
-                            f"ip route add {destination} via {gateway}"
-                        )
-                    except pexpect.TIMEOUT:  # noqa: PERF203
-                        __LOGGER.exception("Failed to set up route %s", route_entry)
-                    except TypeError as exc:
-                        msg = f"Validate the syntax of static-route for {opt_val}."
-                        raise ValueError(msg) from exc
+        opt_val = self._parse_device_suboptions().get("static-route")
+        if opt_val is None:
+            return
+        for route_entry in opt_val.split(";"):
+            try:
+                destination, gateway = map(str.strip, route_entry.split("-"))
+                await self._console.execute_command_async(f"ip route del {destination}")
+                await self._console.execute_command_async(
+                    f"ip route add {destination} via {gateway}"
+                )
+            except pexpect.TIMEOUT:  # noqa: PERF203
+                __LOGGER.exception("Failed to set up route %s", route_entry)
+            except TypeError as exc:
+                msg = f"Validate the syntax of static-route for {opt_val}."
+                raise ValueError(msg) from exc
 
     def _setup_static_routes(self) -> None:
         """Set up static routes for the device.
 
         :raises ValueError: if the syntax is incorrect in inventory
         """
-        options = self._parse_device_suboptions()
-        for option, opt_val in options.items():
-            if option == "static-route":
-                for route_entry in opt_val.split(";"):
-                    try:
-                        destination, gateway = map(str.strip, route_entry.split("-"))
-                        self._console.execute_command(f"ip route del {destination}")
-                        self._console.execute_command(
-                            f"ip route add {destination} via {gateway}"
-                        )
-                    except pexpect.TIMEOUT:  # noqa: PERF203
-                        __LOGGER.exception("Failed to set up route %s", route_entry)
-                    except TypeError as exc:
-                        msg = f"Validate the syntax of static-route for {opt_val}."
-                        raise ValueError(msg) from exc
+        opt_val = self._parse_device_suboptions().get("static-route")
+        if opt_val is None:
+            return
+        for route_entry in opt_val.split(";"):
+            try:
+                destination, gateway = map(str.strip, route_entry.split("-"))
+                self._console.execute_command(f"ip route del {destination}")
+                self._console.execute_command(
+                    f"ip route add {destination} via {gateway}"
+                )
+            except pexpect.TIMEOUT:  # noqa: PERF203
+                __LOGGER.exception("Failed to set up route %s", route_entry)
+            except TypeError as exc:
+                msg = f"Validate the syntax of static-route for {opt_val}."
+                raise ValueError(msg) from exc
 
     @property
     def _ipaddr(self) -> str:
@@ -606,8 +617,8 @@ class LinuxDevice(BoardfarmDevice):
 
         if ping_interface:
             cmd += f" -I {ping_interface}"
-
-        cmd += f" {options}"
+        if options:
+            cmd += f" {options}"
         self._console.sendline(cmd)
         self._console.expect(self._shell_prompt, timeout=timeout)
 
@@ -679,7 +690,7 @@ class LinuxDevice(BoardfarmDevice):
         try:
             self._console.sudo_sendline(f"{command_str} &")
             self._console.expect_exact(f"tcpdump: listening on {interface}")
-            process_id = re.search(r"(\[\d{1,10}\]\s(\d+))", self._console.before)[2]
+            process_id = BACKGROUND_JOB_PID_PATTERN.search(self._console.before)[2]
 
             yield process_id
 
@@ -955,7 +966,7 @@ class LinuxDevice(BoardfarmDevice):
         if "Address already in use" in cmd_output:
             msg = f"Failed to start http service on port {port}."
             raise BoardfarmException(msg)
-        return re.search(r"(\[\d{1,}\]\s(\d+))", cmd_output)[2]
+        return BACKGROUND_JOB_PID_PATTERN.search(cmd_output)[2]
 
     def stop_http_service(self, port: str) -> None:
         """Stop http service running on given port.
@@ -1043,11 +1054,11 @@ class LinuxDevice(BoardfarmDevice):
         :return: response of nmap command in xml/dict format
         :rtype: dict
         """
-        if ip_type not in ["ipv4", "ipv6"]:
+        if ip_type not in ("ipv4", "ipv6"):
             msg = "Invalid ip type, should be either ipv4 or ipv6"
             raise BoardfarmException(msg)
-        retries = f"-max-retries {max_retries}" if max_retries else ""
-        rate = f"-min-rate {min_rate}" if min_rate else ""
+        retries = f"--max-retries {max_retries}" if max_retries else ""
+        rate = f"--min-rate {min_rate}" if min_rate else ""
         port = f"-p {port}" if port else ""
         cmd = (
             f"nmap {protocol or ''} {port} -Pn -r {opts or ''}"
@@ -1432,7 +1443,7 @@ class LinuxDevice(BoardfarmDevice):
             f" --rate {rate} -g 80 {extra_args} &"
         )
         if output:
-            pid = re.search(r"(\[\d+\]\s(\d+))", output)[2]
+            pid = BACKGROUND_JOB_PID_PATTERN.search(output)[2]
             process_status = self._console.execute_command(f"ps --pid {pid} -o stat=")
             if process_status and process_status != "T":
                 return pid
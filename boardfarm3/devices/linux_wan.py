@@ -226,21 +226,22 @@ class LinuxWAN(LinuxDevice, WAN):  # pylint: disable=R0902
                 ping_status[ip_version]["reachable"] += 1
             else:
                 ping_status[ip_version]["unreachable"] += 1
-        for ip_version, item in ping_status.items():
-            if ip_version not in acs_server_config or ip_version != prov_mode:
+        # only the provisioning mode is checked
+        if prov_mode not in ping_status or prov_mode not in acs_server_config:
+            return
+        ip_version = prov_mode
+        for status, value in ping_status[ip_version].items():
+            if status not in acs_server_config[ip_version]:
                 continue
-            for status, value in item.items():
-                if status not in acs_server_config[ip_version]:
-                    continue
-                if acs_server_config[ip_version][status] != value:
-                    msg = (
-                        f"DNS check failed for {ip_version} {status} servers "
-                        "- requested: {acs_server_config[ip_version][status]}, "
-                        "actual: {value}"
-                    )
-                    raise ContingencyCheckError(
-                        msg,
-                    )
+            if acs_server_config[ip_version][status] != value:
+                msg = (
+                    f"DNS check failed for {ip_version} {status} servers "
+                    "- requested: {acs_server_config[ip_version][status]}, "
+                    "actual: {value}"
+                )
+                raise ContingencyCheckError(
+                    msg,
+                )
 
     @property
     def iface_dut(self) -> str:
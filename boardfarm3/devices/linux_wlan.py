@@ -27,6 +27,8 @@ if TYPE_CHECKING:
 
 
 _LOGGER = logging.getLogger(__name__)
+# wpa_supplicant network keys whose values have to be quoted
+_QUOTED_WPA_KEYS = frozenset({"ssid", "psk", "identity", "password"})
 
 
 class LinuxWLAN(LinuxDevice, WLAN):  # pylint: disable=too-many-public-methods
@@ -291,9 +293,8 @@ class LinuxWLAN(LinuxDevice, WLAN):  # pylint: disable=too-many-public-methods
         :return: List of Wi-FI SSIDs
         :rtype: list[str]
         """
-        cmd = (
-            f"iw dev {self.iface_dut} scan | grep SSID: | sed 's/[[:space:]]*SSID: //g'"
-        )
+        # sed prints only the SSID lines, with the "SSID: " prefix removed
+        cmd = f"iw dev {self.iface_dut} scan | sed -n 's/[[:space:]]*SSID: //gp'"
         for _ in range(3):
             out = self._console.execute_command(cmd)
             if "Device or resource busy" not in out:
@@ -347,7 +348,7 @@ class LinuxWLAN(LinuxDevice, WLAN):  # pylint: disable=too-many-public-methods
             config["bssid"] = bssid
         config_str = ""
         for key, value in config.items():
-            if key in ["ssid", "psk", "identity", "password"]:
+            if key in _QUOTED_WPA_KEYS:
                 value = f'"{value}"'
             config_str += f"{key}={value}\n"
         final_config = f"""ctrl_interface=DIR="/etc/wpa_supplicant GROUP=root
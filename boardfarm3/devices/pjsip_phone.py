@@ -3,11 +3,12 @@
 """PJSIPPhone device module."""
 
 import logging
+import re
 from argparse import Namespace
 from contextlib import suppress
 from ipaddress import IPv4Interface, IPv6Interface
 from itertools import cycle
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import pexpect
 from pexpect import TIMEOUT
@@ -21,6 +22,22 @@ from boardfarm3.templates.sip_server import SIPServer
 
 _LOGGER = logging.getLogger(__name__)
 
+_REGISTRATION_SUCCESS = re.compile(r"registration success, status=200 \(OK\)")
+_MAKE_CALL = re.compile(r"Make call\:")
+_CALL_CALLING = re.compile(r"Call [0-9]+ state changed to CALLING")
+_CALL_CONFIRMED = re.compile(r"Call [0-9]+ state changed to CONFIRMED")
+_ANSWER_WITH_CODE = [
+    re.compile(r"Answer with code \(100\-699\) \(empty to cancel\)\:"),
+    re.compile("No pending incoming call"),
+]
+_HANGUP = [re.compile("DISCON"), re.compile("No current call")]
+_REINVITE_SENT = re.compile(r"Sending re-INVITE on call [0-9]+")
+_SDP_NEGOTIATION_DONE = re.compile("SDP negotiation done: Success")
+_CALL_ON_HOLD = re.compile(r"Putting call [0-9]+ on hold")
+_SOUND_DEVICE_CLOSED = re.compile(
+    r"Closing sound device after idle for [0-9]+ second\(s\)"
+)
+
 
 class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
     """Perform Functions related to PJSIPphone software."""
@@ -29,6 +46,11 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
 
     supported_lines = cycle([1])
     _YOU_HAVE_0_ACTIVE_CALL: str = "You have 0 active call"
+    _PHONE_CONFIG_TEMPLATE: str = (
+        "--local-port={port} --id=sip:{number}@{server} --registrar=sip:{server}"
+        " --realm=* --username={number} --password=1234 --null-audio"
+        " --max-calls=1 --auto-answer=180 --no-tcp"
+    )
 
     def __init__(self, config: dict[str, Any], cmdline_args: Namespace) -> None:
         """Instance initialization of the PJSIPPhone class.
@@ -54,6 +76,8 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         self._num_port = self._config.get("num_port", "5060")
         self._config_name = "pjsip.conf"
         self._pjsip_prompt = ">>>"
+        # prompts expected when the phone state is unknown (pjsua or shell)
+        self._any_prompt = [self._pjsip_prompt, *self._shell_prompt]
         self._iface_dut = "eth1"
         # Currently these are static IPs
         # TODO: factorise with the _setup options
@@ -271,6 +295,12 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
             ).ipv4_addr,
         )
 
+    def _build_phone_config(self, ipv6_flag: bool, sipserver_fqdn: str) -> str:
+        conf = self._PHONE_CONFIG_TEMPLATE.format(
+            port=self._num_port, number=self._own_number, server=sipserver_fqdn
+        )
+        return f"{conf} --ipv6" if ipv6_flag else conf
+
     async def phone_config_async(
         self, ipv6_flag: bool, sipserver_fqdn: str = ""
     ) -> None:
@@ -283,27 +313,9 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         """
         # sipserver_fqdn is set to IPv4 address of the sipserver currently
         self._own_number = self._get_number()
-        conf: str = " ".join(
-            [
-                f"--local-port={self._num_port}",
-                f"--id=sip:{self._own_number}@{sipserver_fqdn}",
-                f"--registrar=sip:{sipserver_fqdn}",
-                "--realm=*",
-                f"--username={self._own_number}",
-                "--password=1234",
-                "--null-audio",
-                "--max-calls=1",
-                "--auto-answer=180",
-                "--no-tcp",
-            ]
-        )
-        if ipv6_flag:
-            conf = conf + " --ipv6"
-
+        conf = self._build_phone_config(ipv6_flag, sipserver_fqdn)
         self._console.sendline("\n")
-        idx = await self._console.expect(
-            [self._pjsip_prompt] + self._shell_prompt, async_=True
-        )
+        idx = await self._console.expect(self._any_prompt, async_=True)
         if idx == 0:
             # come out of pjsip prompt
             self._console.sendcontrol("c")
@@ -331,26 +343,9 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         :type ipv6_flag: bool
         """
         self._own_number = self._get_number()
-        conf: str = " ".join(
-            [
-                f"--local-port={self._num_port}",
-                f"--id=sip:{self._own_number}@{sipserver_fqdn}",
-                f"--registrar=sip:{sipserver_fqdn}",
-                "--realm=*",
-                f"--username={self._own_number}",
-                "--password=1234",
-                "--null-audio",
-                "--max-calls=1",
-                "--auto-answer=180",
-                "--no-tcp",
-            ]
-        )
-
-        if ipv6_flag:
-            conf = conf + " --ipv6"
-
+        conf = self._build_phone_config(ipv6_flag, sipserver_fqdn)
         self._console.sendline("\n")
-        idx = self._console.expect([self._pjsip_prompt] + self._shell_prompt)
+        idx = self._console.expect(self._any_prompt)
         if idx == 0:
             # come out of pjsip prompt
             self._console.sendcontrol("c")
@@ -387,7 +382,7 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         except TIMEOUT:
             try:
                 self._console.sendline("pjsua --config-file=" + self._config_name)
-                self._console.expect(r"registration success, status=200 \(OK\)")
+                self._console.expect(_REGISTRATION_SUCCESS)
                 self._console.sendline("\n")
                 self._console.expect(self._pjsip_prompt)
                 self._phone_started = True
@@ -395,11 +390,16 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
                 self._phone_started = False
                 raise VoiceError("Failed to start Phone!!") from exc
 
-    def _select_option_make_call(self) -> None:
-        self._console.sendline("\n")
+    def _send_menu_command(
+        self, command: str, pattern: Union[str, re.Pattern, list[re.Pattern]]
+    ) -> int:
+        # the prompt sync and the menu command are sent in a single write
+        self._console.sendline(f"\n{command}")
         self._console.expect(self._pjsip_prompt)
-        self._console.sendline("m")
-        self._console.expect(r"Make call\:")
+        return self._console.expect(pattern)
+
+    def _select_option_make_call(self) -> None:
+        self._send_menu_command("m", _MAKE_CALL)
 
     def _is_phone_started(self) -> None:
         if not self.phone_started:
@@ -416,7 +416,7 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         self._is_phone_started()
         self._select_option_make_call()
         self._console.sendline("sip:" + sequence + "@" + self._proxy_ip)
-        self._console.expect("Call [0-9]* state changed to CALLING")
+        self._console.expect(_CALL_CALLING)
         self._console.sendline("\n")
         self._console.expect(self._pjsip_prompt)
 
@@ -427,19 +427,11 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         :rtype: bool
         """
         self._is_phone_started()
-        self._console.sendline("\n")
-        self._console.expect(self._pjsip_prompt)
-        self._console.sendline("a")
-        idx = self._console.expect(
-            [
-                r"Answer with code \(100\-699\) \(empty to cancel\)\:",
-                "No pending incoming call",
-            ]
-        )
+        idx = self._send_menu_command("a", _ANSWER_WITH_CODE)
         if idx == 1:
             return False
         self._console.sendline("200")
-        self._console.expect("Call [0-9]* state changed to CONFIRMED")
+        self._console.expect(_CALL_CONFIRMED)
         self._console.sendline("\n")
         self._console.expect(self._pjsip_prompt)
         return True
@@ -447,21 +439,15 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
     def hangup(self) -> None:
         """To hangup the ongoing call."""
         self._is_phone_started()
-        self._console.sendline("\n")
-        self._console.expect(self._pjsip_prompt)
-        self._console.sendline("h")
-        self._console.expect(["DISCON", "No current call"])
+        self._send_menu_command("h", _HANGUP)
         self._console.sendline("\n")
         self._console.expect(self._pjsip_prompt)
 
     def reinvite(self) -> None:
         """To re-trigger the Invite message."""
         self._is_phone_started()
-        self._console.sendline("\n")
-        self._console.expect(self._pjsip_prompt)
-        self._console.sendline("v")
-        self._console.expect("Sending re-INVITE on call [0-9]*")
-        self._console.expect("SDP negotiation done: Success")
+        self._send_menu_command("v", _REINVITE_SENT)
+        self._console.expect(_SDP_NEGOTIATION_DONE)
         self._console.sendline("\n")
         self._console.expect(self._pjsip_prompt)
 
@@ -473,10 +459,7 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
     def hold(self) -> None:
         """To hold the current call."""
         self._is_phone_started()
-        self._console.sendline("\n")
-        self._console.expect(self._pjsip_prompt)
-        self._console.sendline("H")
-        self._console.expect("Putting call [0-9]* on hold")
+        self._send_menu_command("H", _CALL_ON_HOLD)
         self._console.sendline("\n")
         self._console.expect(self._pjsip_prompt)
 
@@ -515,10 +498,7 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
 
     def _send_update_and_validate(self, msg: str) -> bool:
         with suppress(pexpect.TIMEOUT):
-            self._console.sendline("\n")
-            self._console.expect(self._pjsip_prompt)
-            self._console.sendline("U")
-            self._console.expect(msg)
+            self._send_menu_command("U", msg)
         return True
 
     def on_hook(self) -> None:
@@ -640,9 +620,7 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         with suppress(pexpect.TIMEOUT):
             self._console.sendline("\n")
             self._console.expect(self._pjsip_prompt)
-            self._console.expect(
-                r"Closing sound device after idle for [0-9]* second\(s\)"
-            )
+            self._console.expect(_SOUND_DEVICE_CLOSED)
             self._console.sendline("\n")
         return True
 
@@ -695,15 +673,7 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
         :raises VoiceError: if there is no incoming call
         """
         self._is_phone_started()
-        self._console.sendline("\n")
-        self._console.expect(self._pjsip_prompt)
-        self._console.sendline("a")
-        idx = self._console.expect(
-            [
-                r"Answer with code \(100\-699\) \(empty to cancel\)\:",
-                "No pending incoming call",
-            ]
-        )
+        idx = self._send_menu_command("a", _ANSWER_WITH_CODE)
         if idx == 1:
             raise VoiceError("No incoming call to reply to!!")
         self._console.sendline(f"{code}")
@@ -797,7 +767,7 @@ class PJSIPPhone(LinuxDevice, SIPPhoneTemplate):
     def _dial_feature_code(self, code: str) -> None:
         self._select_option_make_call()
         self._console.sendline(f"sip:{code}@{self._proxy_ip}")
-        self._console.expect("Call [0-9]* state changed to CALLING")
+        self._console.expect(_CALL_CALLING)
         if not self.is_code_ended():
             raise VoiceError(f"Call not ended after dialing a feature code: {code}")
 
@@ -314,11 +314,17 @@ class RPiRDKBSW(CPESwLibraries):  # pylint: disable=R0904
         val = retry_on_exception(
             method=self.dmcli.GPV,
             args=("Device.DeviceInfo.ManufacturerOUI",),
+            retries=8,
+            tout=1,
+            max_tout=8,
         )
         oui = val.rval
         val = retry_on_exception(
             method=self.dmcli.GPV,
             args=("Device.DeviceInfo.ProductClass",),
+            retries=8,
+            tout=1,
+            max_tout=8,
         )
         prod_class = val.rval
         return f"{oui}-{prod_class}-{self._hw.serial_number}"
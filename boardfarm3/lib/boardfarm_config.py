@@ -13,6 +13,13 @@ import requests
 from boardfarm3.exceptions import EnvConfigError
 from boardfarm3.lib.utils import get_value_from_dict
 
+_WIFI_DEVICE_TYPES = frozenset({"bf_wlan", "debian_wifi"})
+_LAN_DEVICE_TYPES = frozenset({"bf_lan", "debian_lan"})
+# jsonmerge.merge() builds a new Merger (and its schema validator) per call,
+# modules merging configs share this one instead
+JSON_MERGER = jsonmerge.Merger({})
+_MISSING = object()
+
 
 class BoardfarmConfig:
     """Boardfarm environment config."""
@@ -34,6 +41,16 @@ class BoardfarmConfig:
         self._env_config = env_config
         self._inventory_config = inventory_config
         self._merged_devices_config = merged_config
+        # resolve the board env subtree once, the board getters read from it
+        environment_def = env_config.get("environment_def")
+        board = (
+            environment_def.get("board") if isinstance(environment_def, dict) else None
+        )
+        self._board_env_config: dict[str, Any] = (
+            board if isinstance(board, dict) else {}
+        )
+        # filled on lookup misses, see get_device_config
+        self._devices_config_by_name: dict[str, dict[str, Any]] = {}
 
     @property
     def env_config(self) -> dict[str, Any]:
@@ -81,9 +98,16 @@ class BoardfarmConfig:
         :returns: merged device config
         :raises EnvConfigError: when given device name is unknown
         """
+        if (device_config := self._devices_config_by_name.get(device_name)) is not None:
+            return device_config
+        # the devices list may have changed since the index was last filled,
+        # on duplicate names the first entry wins
         for device_config in self._merged_devices_config:
-            if device_config.get("name") == device_name:
-                return device_config
+            self._devices_config_by_name.setdefault(
+                device_config.get("name"), device_config
+            )
+        if (device_config := self._devices_config_by_name.get(device_name)) is not None:
+            return device_config
         msg = f"{device_name} - Unknown device name"
         raise EnvConfigError(msg)
 
@@ -93,11 +117,10 @@ class BoardfarmConfig:
         :return: SKU value
         :raises EnvConfigError: when given sku is unknown
         """
-        try:
-            return self.env_config["environment_def"]["board"]["SKU"]
-        except (KeyError, AttributeError) as e:
+        if (sku := self._board_env_config.get("SKU", _MISSING)) is _MISSING:
             msg = "Board SKU is not found in env config."
-            raise EnvConfigError(msg) from e
+            raise EnvConfigError(msg)
+        return cast("str", sku)
 
     def get_board_model(self) -> str:
         """Return the env config ["environment_def"]["board"]["model"].
@@ -105,13 +128,10 @@ class BoardfarmConfig:
         :return: Board model
         :raises EnvConfigError: when given model is unknown
         """
-        try:
-            return self.env_config["environment_def"]["board"]["model"]
-        except (KeyError, AttributeError) as e:
+        if (model := self._board_env_config.get("model", _MISSING)) is _MISSING:
             msg = "Unable to find board.model entry in env config."
-            raise EnvConfigError(
-                msg,
-            ) from e
+            raise EnvConfigError(msg)
+        return cast("str", model)
 
     def get_prov_mode(self) -> str:
         """Return the provisioning mode of the DUT.
@@ -119,15 +139,14 @@ class BoardfarmConfig:
         :return: ipv4, ipv6, dslite, dualstack, disabled
         :raises EnvConfigError: when given sku is unknown
         """
-        try:
-            return self.env_config["environment_def"]["board"][
-                "eRouter_Provisioning_mode"
-            ]
-        except (KeyError, AttributeError) as e:
+        if (
+            prov_mode := self._board_env_config.get(
+                "eRouter_Provisioning_mode", _MISSING
+            )
+        ) is _MISSING:
             msg = "Unable to find eRouter_Provisioning_mode entry in env config."
-            raise EnvConfigError(
-                msg,
-            ) from e
+            raise EnvConfigError(msg)
+        return cast("str", prov_mode)
 
 
 def _merge_with_wifi_config(
@@ -152,12 +171,15 @@ def _merge_with_wifi_config(
     wifi_devices_copy = deepcopy(wifi_devices)
     wifi_clients = sorted(wifi_clients, key=lambda x: x.get("band"))
     wifi_devices_copy = sorted(wifi_devices_copy, key=lambda x: x.get("band"))
+    device_bands = [wifi_device.get("band") for wifi_device in wifi_devices_copy]
+    # flags the wifi devices already assigned to a wifi client
+    used = [False] * len(wifi_devices_copy)
     for wifi_client in wifi_clients:
-        found = None
-        for wifi_device in wifi_devices_copy:
-            if wifi_device.get("band") in {wifi_client.get("band"), "dual"}:
-                merged_wifi_devices.append(wifi_device.copy() | wifi_client.copy())
-                found = wifi_device
+        bands = {wifi_client.get("band"), "dual"}
+        for index, wifi_device in enumerate(wifi_devices_copy):
+            if not used[index] and device_bands[index] in bands:
+                merged_wifi_devices.append(wifi_device | wifi_client)
+                used[index] = True
                 break
         else:
             msg = (
@@ -165,8 +187,6 @@ def _merge_with_wifi_config(
                 "env config Wi-Fi client in inventory config"
             )
             raise EnvConfigError(msg)
-        if found:
-            wifi_devices_copy.remove(found)
     return merged_wifi_devices
 
 
@@ -263,29 +283,24 @@ def parse_boardfarm_config(
     """
     # disable jsonmerge debug logs
     logging.getLogger("jsonmerge").setLevel(logging.WARNING)
-    wifi_devices = [
-        device
-        for device in inventory_config["devices"]
-        if device["type"] in ["bf_wlan", "debian_wifi"]
-    ]
-    lan_devices = [
-        device
-        for device in inventory_config["devices"]
-        if device["type"] in ["bf_lan", "debian_lan"]
-    ]
-    other_devices = [
-        device
-        for device in inventory_config["devices"]
-        if device not in wifi_devices + lan_devices
-    ]
+    wifi_devices: list[dict[str, Any]] = []
+    lan_devices: list[dict[str, Any]] = []
+    other_devices: list[dict[str, Any]] = []
+    for device in inventory_config["devices"]:
+        if device["type"] in _WIFI_DEVICE_TYPES:
+            wifi_devices.append(device)
+        elif device["type"] in _LAN_DEVICE_TYPES:
+            lan_devices.append(device)
+        else:
+            other_devices.append(device)
     merged_devices_config = []
     environment_def = env_json_config.get("environment_def")
     for device in other_devices:
-        device_name = device.get("name")
+        device_env_config = environment_def.get(device.get("name"), _MISSING)
         merged_devices_config.append(
             (
-                jsonmerge.merge(device, environment_def[device_name])
-                if device_name in environment_def
+                JSON_MERGER.merge(device, device_env_config)
+                if device_env_config is not _MISSING
                 else device
             ),
         )
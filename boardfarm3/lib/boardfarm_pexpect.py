@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import re
 from abc import ABCMeta, abstractmethod
-from logging import Formatter, Logger, getLogger
+from logging import DEBUG, Formatter, Logger, getLogger
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
@@ -14,19 +14,17 @@ import pexpect
 
 from boardfarm3.lib.utils import disable_logs
 
+_CHAR_WITH_BACKSPACE_PATTERN = re.compile(r"(.\x08\x1b\x5b\x4b)|(.\x08\x20\x08)")
+_BACKSPACE_PATTERN = re.compile(r"(\x08\x1b\x5b\x4b)|(\x08\x20\x08)")
+
 
 def _apply_backspace(string: str) -> str:
     while True:
         # if you find a character followed by a backspace, remove both
-        char_with_backspace = re.sub(
-            r"(.\x08\x1b\x5b\x4b)|(.\x08\x20\x08)",
-            "",
-            string,
-            count=1,
-        )
+        char_with_backspace = _CHAR_WITH_BACKSPACE_PATTERN.sub("", string, count=1)
         if len(string) == len(char_with_backspace):
             # now remove any backspaces from beginning of the string
-            return re.sub(r"(\x08\x1b\x5b\x4b)|(\x08\x20\x08)", "", char_with_backspace)
+            return _BACKSPACE_PATTERN.sub("", char_with_backspace)
         string = char_with_backspace
 
 
@@ -35,6 +33,8 @@ class _LogWrapper:
 
     # pylint: disable=missing-docstring  # wrapper to console logging
 
+    __slots__ = ("_lastline", "_logger")
+
     _chars_to_remove = re.compile(
         r"\x1B(?:[@-Z\\-_]|\[[0-?]*["
         r" -/]*[@-~])|\r|\n|\x1B[78]|\x07|(\x1b\x5b\x48\x1b\x5b\x4a)",
@@ -54,6 +54,9 @@ class _LogWrapper:
             lines = lines[:-1]
         else:
             self._lastline = ""
+        # skip the per line clean up when nobody records the console output
+        if not self._logger.isEnabledFor(DEBUG):
+            return
         for _line in lines:
             line = _apply_backspace(_line)
             self._logger.debug(
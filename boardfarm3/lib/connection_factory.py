@@ -1,6 +1,6 @@
 """Connection decider module."""
 
-from typing import Any
+from typing import Any, Callable
 
 from boardfarm3.exceptions import EnvConfigError
 from boardfarm3.lib.boardfarm_pexpect import BoardfarmPexpect
@@ -25,17 +25,8 @@ def connection_factory(
     :returns: BoardfarmPexpect: connection of given type
     :raises EnvConfigError: when given connection type is not supported
     """
-    connection_dispatcher = {
-        "ssh_connection": SSHConnection,
-        "authenticated_ssh": SSHConnection,
-        "ldap_authenticated_serial": LdapAuthenticatedSerial,
-        "local_cmd": LocalCmd,
-        "serial": SerialConnection,
-        "ser2net": _ser2net_param_parser,
-        "telnet": _telnet_param_parser,
-    }
-    connection_obj = connection_dispatcher.get(connection_type)
-    if connection_obj is not None and callable(connection_obj):
+    connection_obj = _CONNECTION_DISPATCHER.get(connection_type)
+    if connection_obj is not None:
         if connection_type == "ssh_connection":
             kwargs.pop("password")
         return connection_obj(connection_name, **kwargs)
@@ -74,3 +65,14 @@ def _ser2net_param_parser(
             kwargs["shell_prompt"],
         ],
     )
+
+
+_CONNECTION_DISPATCHER: dict[str, Callable[..., BoardfarmPexpect]] = {
+    "ssh_connection": SSHConnection,
+    "authenticated_ssh": SSHConnection,
+    "ldap_authenticated_serial": LdapAuthenticatedSerial,
+    "local_cmd": LocalCmd,
+    "serial": SerialConnection,
+    "ser2net": _ser2net_param_parser,
+    "telnet": _telnet_param_parser,
+}
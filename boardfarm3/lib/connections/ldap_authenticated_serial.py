@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import pexpect
@@ -11,6 +12,7 @@ from boardfarm3.lib.connections.ssh_connection import SSHConnection
 
 _CONNECTION_FAILED_STR: str = "Failed to connect to device via serial"
 _EOF_INDEX = 2
+_PASSWORD_PROMPTS = [re.compile("Password:"), pexpect.EOF, pexpect.TIMEOUT]
 
 
 class LdapAuthenticatedSerial(SSHConnection):
@@ -66,7 +68,7 @@ class LdapAuthenticatedSerial(SSHConnection):
         """
         if password is None:
             password = self._password
-        if self.expect(["Password:", pexpect.EOF, pexpect.TIMEOUT]):
+        if self.expect(_PASSWORD_PROMPTS):
             raise DeviceConnectionError(_CONNECTION_FAILED_STR)
         self.sendline(password)
 
@@ -96,7 +98,7 @@ class LdapAuthenticatedSerial(SSHConnection):
         """
         if password is None:
             password = self._password
-        if await self.expect(["Password:", pexpect.EOF, pexpect.TIMEOUT], async_=True):
+        if await self.expect(_PASSWORD_PROMPTS, async_=True):
             raise DeviceConnectionError(_CONNECTION_FAILED_STR)
         self.sendline(password)
 
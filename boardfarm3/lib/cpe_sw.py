@@ -25,6 +25,9 @@ if TYPE_CHECKING:
     from boardfarm3.templates.cpe.cpe_hw import CPEHW
 
 
+_SUPPORTED_EROUTER_MODES = frozenset({"dual", "ipv4", "ipv6"})
+
+
 # pylint: disable-next=too-many-public-methods
 class CPESwLibraries(CPESW):
     """CPE SW common libraries."""
@@ -106,7 +109,7 @@ class CPESwLibraries(CPESW):
         :raises ValueError: if erouter mode not in ["dual", "ipv4", "ipv6"]
         """
         mode = self._hw.config.get("eRouter_Provisioning_mode", "dual")
-        if mode not in ["dual", "ipv4", "ipv6"]:
+        if mode not in _SUPPORTED_EROUTER_MODES:
             msg = f"Unsupported mode: {mode}"
             raise ValueError(msg)
         online: bool = True
@@ -30,6 +30,9 @@ class ICMPPacketData:
         * Type 14 = Timestamp Reply
     """
 
+    # one instance per captured packet, keep them small
+    __slots__ = ("destination", "query_code", "source")
+
     query_code: int
     source: IPAddresses
     destination: IPAddresses
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import json
-from copy import deepcopy
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import jsonmerge
 
+from boardfarm3.lib.boardfarm_config import JSON_MERGER
+
 if TYPE_CHECKING:
     from boardfarm3.lib.boardfarm_config import BoardfarmConfig
 
 
 _DEVICE_MAP = {"EXT_VOIP": "softphone", "SIP": "sipcenter"}
+# env config lists that hold nested device sections instead of device entries
+_NESTED_DEVICES_KEYS = frozenset({"BOARD", "device_options"})
+_RECURSIVE_MERGER = jsonmerge.Merger({"recursiveMergeStrategy": "merge"})
 
 
 # pylint: disable=too-few-public-methods
@@ -115,9 +119,10 @@ class DockerComposeGenerator:
         requested_devices = self._get_requested_device_count(device_name.upper())
         device_compose: dict[str, Any] = {}
         for device_count in range(requested_devices):
-            base_device = deepcopy(device_template)
+            # _replace() rebuilds every list and dict of the template, so the
+            # template is not shared with the generated compose
             base_device = self._replace(
-                base_device,
+                device_template,
                 device_name,
                 f"{device_name}{device_count + 1}",
             )
@@ -134,14 +139,11 @@ class DockerComposeGenerator:
                     f"softphone{device_count + 1}",
                 )
             if isinstance(base_device, dict):
-                base_device["services"][device_name]["ports"] = self._update_ports(
-                    base_device["services"][device_name]["ports"],
-                    device_count,
-                )
-                base_device["services"][f"{device_name}{device_count + 1}"] = (
-                    base_device["services"].pop(device_name)
-                )
-                device_compose = jsonmerge.merge(device_compose, base_device)
+                services = base_device["services"]
+                service = services.pop(device_name)
+                service["ports"] = self._update_ports(service["ports"], device_count)
+                services[f"{device_name}{device_count + 1}"] = service
+                device_compose = JSON_MERGER.merge(device_compose, base_device)
         return device_compose
 
     def _generate_base_compose(self) -> dict[str, Any]:
@@ -176,11 +178,7 @@ class DockerComposeGenerator:
     def _merge_dicts(self, *dicts: dict[str, Any]) -> dict[str, Any]:
         merged_dict: dict[str, Any] = {}
         for dictionary in dicts:
-            merged_dict = jsonmerge.merge(
-                merged_dict,
-                dictionary,
-                {"recursiveMergeStrategy": "merge"},
-            )
+            merged_dict = _RECURSIVE_MERGER.merge(merged_dict, dictionary)
         return merged_dict
 
     def _get_devices(self, env_config: dict[str, Any]) -> None:
@@ -192,21 +190,15 @@ class DockerComposeGenerator:
         :type env_config: dict[str, Any]
         """
         for config_key, config_value in env_config.items():
-            if (
-                isinstance(config_value, dict)
-                and "device_type" not in config_value
-                and config_key != "BOARD"
-            ):
-                self._get_devices(config_value)
-            if isinstance(config_value, list) and config_key not in (
-                "BOARD",
-                "device_options",
-            ):
-                self._devices_list.append(config_key.lower())
-            if isinstance(config_value, list) and config_key == "device_options":
-                self._get_devices(next((item for item in config_value), {}))
-            if config_key == "BOARD" and isinstance(config_value, list):
-                self._get_devices(next((item for item in config_value), {}))
+            if isinstance(config_value, dict):
+                if "device_type" not in config_value and config_key != "BOARD":
+                    self._get_devices(config_value)
+            elif isinstance(config_value, list):
+                if config_key in _NESTED_DEVICES_KEYS:
+                    # only the first entry describes the nested devices
+                    self._get_devices(next(iter(config_value), {}))
+                else:
+                    self._devices_list.append(config_key.lower())
 
     def generate_docker_compose(self) -> dict[str, Any]:
         """Generate the docker-compose yml to be used as payload for docker factory.
@@ -220,7 +212,7 @@ class DockerComposeGenerator:
                 base_compose,
                 self._generate_device_compose(device),
             )
-        return jsonmerge.merge(
+        return JSON_MERGER.merge(
             base_compose,
             self._generate_orchestrator_compose(list(base_compose["services"].keys())),
         )
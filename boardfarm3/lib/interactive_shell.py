@@ -7,6 +7,7 @@ import re
 import sys
 import time
 from argparse import Namespace
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 import jedi
@@ -256,6 +257,13 @@ def _add_session_marker_in_console_logs() -> None:
             logger.debug("#" * 80)
 
 
+@cache
+def _is_pytest_boardfarm_installed() -> bool:
+    # scanning the installed distributions metadata is expensive and its
+    # result does not change during a boardfarm session
+    return bool(entry_points(group="pytest11", name="pytest_boardfarm"))
+
+
 def get_interactive_console_options(
     device_manager: DeviceManager,
     cmdline_args: Namespace,
@@ -281,7 +289,7 @@ def get_interactive_console_options(
         (cmdline_args, device_manager),
         {},
     )
-    if entry_points(group="pytest11", name="pytest_boardfarm"):
+    if _is_pytest_boardfarm_installed():
         table.add_option(
             ("e", "execute boardfarm automated test(s)"),
             _run_boardfarm_tests,
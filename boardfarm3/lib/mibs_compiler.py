@@ -77,11 +77,8 @@ class MibsCompiler:
         :returns: OID of the given MIB
         :raises ValueError: when unable to find given mib
         """
-        if (
-            mib_name in self._mibs_dict
-            and self._mibs_dict.get(mib_name, None)
-            and "oid" in self._mibs_dict[mib_name]
-        ):
-            return self._mibs_dict[mib_name]["oid"]
+        mib = self._mibs_dict.get(mib_name)
+        if mib and "oid" in mib:
+            return mib["oid"]
         msg = f"Unable to find OID of {mib_name!r} MIB"
         raise ValueError(msg)
@@ -105,6 +105,21 @@ class IPerfResult:
         return self._data
 
 
+def read_and_remove_iperf_output(console: BoardfarmPexpect, output_file: str) -> str:
+    """Return the content of an iperf output file and delete the file.
+
+    Both are done in a single console round trip.
+
+    :param console: console of the device running the iperf session
+    :type console: BoardfarmPexpect
+    :param output_file: iperf output file
+    :type output_file: str
+    :return: content of the output file
+    :rtype: str
+    """
+    return console.execute_command(f"cat {output_file}; rm -f {output_file}")
+
+
 class Multicast:
     """Multicast device component."""
 
@@ -476,9 +491,7 @@ class Multicast:
             )
         # kill -15 iperf session
         self._console.execute_command(f"kill -15 {session.pid}")
-        output = self._console.execute_command(f"cat {session.output_file}")
-        # remove the file after reading results
-        self._console.execute_command(f"rm {session.output_file}")
+        output = read_and_remove_iperf_output(self._console, session.output_file)
         if not output.strip():
             return IPerfResult(None)
 
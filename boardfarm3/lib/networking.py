@@ -8,7 +8,6 @@ from ipaddress import IPv4Address, IPv6Address, ip_address
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 import pexpect
-from bs4 import BeautifulSoup
 from jc.parsers import dig
 
 from boardfarm3.exceptions import SCPConnectionError, UseCaseFailure
@@ -23,6 +22,12 @@ if TYPE_CHECKING:
     from boardfarm3.templates.wlan import WLAN
 
 
+# "[job] pid" line printed by the shell when a command is sent to background
+BACKGROUND_JOB_PID_PATTERN = re.compile(r"(\[\d+\]\s(\d+))")
+_HTML_BODY_PATTERN = re.compile(r"\<[\!DOC|head][\S\n ].+body\>", re.DOTALL)
+_HTTP_STATUS_CODE_PATTERN = re.compile(r"< HTTP\/.*\s(\d+)")
+
+
 class _LinuxConsole(Protocol):
     """Linux console protocol."""
 
@@ -88,7 +93,9 @@ def start_tcpdump(  # noqa: PLR0913
     """
     command = f"tcpdump -U -i {interface} -n -w {output_file} "
     filter_str = (
-        " ".join([" ".join(i) for i in filters.items()]) if filters is not None else ""
+        " ".join(f"{key} {value}" for key, value in filters.items())
+        if filters is not None
+        else ""
     )
     filter_str += additional_filters
     if port:
@@ -98,7 +105,7 @@ def start_tcpdump(  # noqa: PLR0913
     if console.expect_exact([f"tcpdump: listening on {interface}", pexpect.TIMEOUT]):
         msg = f"Failed to start tcpdump on {interface}"
         raise ValueError(msg)
-    return re.search(r"(\[\d+\]\s(\d+))", output)[2]
+    return BACKGROUND_JOB_PID_PATTERN.search(output)[2]
 
 
 def stop_tcpdump(console: _LinuxConsole, process_id: str) -> None:
@@ -144,10 +151,10 @@ def tcpdump_read(  # noqa: PLR0913
     :return: tcpdump output
     :rtype: str
     """
-    if opts:
-        protocol = f"{protocol} and {opts}"
+    # an empty protocol or opts must not leave a dangling "and" in the filter
+    read_filter = " and ".join(value for value in (protocol, opts) if value)
     tcpdump_output = console.execute_command(
-        f"tcpdump -n -r {capture_file} {protocol}",
+        f"tcpdump -n -r {capture_file} {read_filter}",
         timeout=timeout,
     )
     if rm_pcap:
@@ -576,18 +583,23 @@ class HTTPResult:  # pylint: disable=too-few-public-methods
         if "Connection refused" in response or "Connection timed out" in response:
             msg = f"Curl Failure due to the following reason {response}"
             raise UseCaseFailure(msg)
-        raw_search_output = re.findall(
-            r"\<[\!DOC|head][\S\n ].+body\>",
-            response,
-            re.DOTALL,
+        # the greedy DOTALL body pattern rescans the whole response from every
+        # tag when no closing "body>" is present, so only run it when it can match
+        raw_search_output = (
+            _HTML_BODY_PATTERN.search(response) if "body>" in response else None
         )
-        raw = raw_search_output[0] if raw_search_output else ""
+        raw = raw_search_output.group() if raw_search_output else ""
 
-        code_search_output = re.findall(r"< HTTP\/.*\s(\d+)", response)
+        code_search_output = _HTTP_STATUS_CODE_PATTERN.findall(response)
         code = code_search_output[0] if code_search_output else ""
 
         beautified_text = ""
         if raw:
+            # bs4 accounts for more than half of this module's import time and
+            # is only needed once a HTML body was actually received
+            # pylint: disable-next=import-outside-toplevel
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(raw, "html.parser")
             beautified_text = str(soup.prettify())
 
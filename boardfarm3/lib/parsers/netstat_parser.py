@@ -1,6 +1,7 @@
 """Parse netstat command lines output into dataframes."""
 
 import collections
+from functools import lru_cache
 from io import BytesIO
 from typing import Any
 
@@ -8,6 +9,8 @@ from pandas import DataFrame
 
 # flake8: noqa
 
+_ADDRESS_FIELDS = frozenset({"Local", "Foreign"})
+
 
 # pylint: disable=too-few-public-methods
 class NetstatParser:
@@ -47,54 +50,31 @@ class NetstatParser:
         return DataFrame(self._inet_connections, columns=inet_header)
 
     # TODO: Rewrite this complex function
-    # pylint: disable-next=inconsistent-return-statements,too-many-branches,too-many-locals
+    # pylint: disable-next=inconsistent-return-statements,too-many-branches
     def _parse_inet_connection(  # noqa: C901, RUF100
         # ruff is not aware of C901, RUF100 is needed for coexistence
         self,
         line: bytes,
         header: bytes,
         sep: str = " ",
-    ) -> tuple[list[str], Any]:
+    ) -> tuple[tuple[str, ...], Any]:
         lines = line.decode("utf-8").split(sep)
-        headers = header.decode("utf-8").split(sep)
         fields = [it.replace("\r\n", "") for it in lines if it not in [sep, "", "\r\n"]]
-        fields1 = [
-            it1.replace("-", "")
-            for it1 in headers
-            if it1 != " " and it1 != "" and it1 not in "\r\n"
-        ]
-
-        fields1 = [
-            word for word in fields1 if word not in "Address" and word not in "name"
-        ]
-
+        fields1, inet_header, inet_connection = _parse_inet_header(header, sep)
         dict_val = {}
-        inet_header: list[str] = []
-        for val in fields1:
-            if val == "Foreign":
-                inet_header.extend(("ForeignAddress", "ForeignPort"))
-            elif val == "Local":
-                inet_header.extend(("LocalAddress", "LocalPort"))
-            elif val == "PID/Program":
-                inet_header.extend(("PID", "Program"))
-            else:
-                inet_header.append(val)
-        inet_connection = collections.namedtuple(  # type: ignore
-            "inet_connection",
-            inet_header,
-        )
         try:  # pylint: disable=too-many-nested-blocks
             if not fields:
                 return  # type: ignore
+            is_udp = fields[0].upper() == "UDP"
             for idx in range(len(fields1)):  # pylint: disable=consider-using-enumerate
-                if fields1[idx] in ["Local", "Foreign"]:
+                if fields1[idx] in _ADDRESS_FIELDS:
                     portpos = fields[idx].rfind(":")
                     dict_val[fields1[idx] + "Address"] = fields[idx][:portpos]
                     dict_val[fields1[idx] + "Port"] = fields[idx][portpos + 1 :]
-                elif fields[0].upper() == "UDP" and fields1[idx] == "State":
+                elif is_udp and fields1[idx] == "State":
                     dict_val["State"] = ""
                 elif "PID" in fields1[idx]:
-                    if fields[0].upper() == "UDP":
+                    if is_udp:
                         idx = idx - 1
                     dict_val["PID"], dict_val["Program"] = fields[idx].split("/")
                 else:
@@ -105,3 +85,36 @@ class NetstatParser:
             raise ValueError(
                 msg,
             ) from e
+
+
+@lru_cache(maxsize=8)
+def _parse_inet_header(
+    header: bytes, sep: str
+) -> tuple[tuple[str, ...], tuple[str, ...], Any]:
+    # the header is the same for every connection line of a netstat output,
+    # parse it and build the namedtuple type only once, the cached fields are
+    # returned as tuples so that callers can't modify them
+    headers = header.decode("utf-8").split(sep)
+    fields1 = [
+        it1.replace("-", "")
+        for it1 in headers
+        if it1 != " " and it1 != "" and it1 not in "\r\n"
+    ]
+
+    fields1 = [word for word in fields1 if word not in "Address" and word not in "name"]
+
+    inet_header: list[str] = []
+    for val in fields1:
+        if val == "Foreign":
+            inet_header.extend(("ForeignAddress", "ForeignPort"))
+        elif val == "Local":
+            inet_header.extend(("LocalAddress", "LocalPort"))
+        elif val == "PID/Program":
+            inet_header.extend(("PID", "Program"))
+        else:
+            inet_header.append(val)
+    inet_connection = collections.namedtuple(  # type: ignore
+        "inet_connection",
+        inet_header,
+    )
+    return tuple(fields1), tuple(inet_header), inet_connection
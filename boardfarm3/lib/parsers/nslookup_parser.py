@@ -24,8 +24,8 @@ class NslookupParser:
         for i in val.split("\r\n\r\n"):
             if "Server" in i:
                 for expr in [ValidIpv4AddressRegex, AllValidIpv6AddressesRegex]:
-                    if re.search(expr, i):
-                        matches = re.search(expr, i)[0]
+                    if server_ip := re.search(expr, i):
+                        matches = server_ip[0]
                         break
                 dns_dict_obj["dns_server"] = matches
             elif "Name" in i:
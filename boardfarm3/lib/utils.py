@@ -83,6 +83,8 @@ def retry_on_exception(
     args: list | tuple,
     retries: int = 10,
     tout: int = 5,
+    *,
+    max_tout: int | None = None,
 ) -> Any:  # noqa: ANN401
     """Retry a method if any exception occurs.
 
@@ -98,6 +100,9 @@ def retry_on_exception(
     :type retries: int
     :param tout: sleep time after every exception occur, defaults to 5
     :type tout: int
+    :param max_tout: double the sleep time after every exception up to this
+                     value, defaults to None (constant sleep time)
+    :type max_tout: int | None
     :return: output of the function
     :rtype: Any
     """
@@ -109,6 +114,8 @@ def retry_on_exception(
         ) as exc:
             _LOGGER.debug("method failed %d time (%s)", re_try, exc)
             time.sleep(tout)
+            if max_tout is not None:
+                tout = min(tout * 2, max_tout)
     return method(*args)
 
 
@@ -2,7 +2,6 @@
 
 import logging
 from argparse import ArgumentParser, ArgumentTypeError, Namespace
-from collections import ChainMap
 from collections.abc import Generator
 from typing import Any
 
@@ -46,6 +45,27 @@ def _non_empty_str(arg: str) -> str:
     raise ArgumentTypeError(message)
 
 
+def _get_known_devices(
+    plugin_manager: PluginManager,
+) -> dict[str, type[BoardfarmDevice]]:
+    """Return the device type to device class index of all registered plugins.
+
+    The boardfarm_add_devices hook results are merged into a single dictionary
+    so each inventory device is resolved with one lookup.
+
+    :param plugin_manager: plugin manager
+    :type plugin_manager: PluginManager
+    :return: device type to device class mapping
+    :rtype: dict[str, type[BoardfarmDevice]]
+    """
+    known_devices: dict[str, type[BoardfarmDevice]] = {}
+    # hook results are ordered from the last registered plugin to the first
+    # one, the last registered plugin providing a device type takes precedence
+    for devices in reversed(plugin_manager.hook.boardfarm_add_devices()):
+        known_devices.update(devices)
+    return known_devices
+
+
 @hookimpl
 def boardfarm_add_hookspecs(plugin_manager: PluginManager) -> None:
     """Add boardfarm core plugin hookspecs.
@@ -192,15 +212,15 @@ def boardfarm_register_devices(
     :rtype: DeviceManager
     """
     device_manager = DeviceManager(plugin_manager)
-    known_devices_list = ChainMap(*plugin_manager.hook.boardfarm_add_devices())
-    to_be_ignored = cmdline_args.ignore_devices.split(",")
+    known_devices = _get_known_devices(plugin_manager)
+    to_be_ignored = set(cmdline_args.ignore_devices.split(","))
     for device_config in config.get_devices_config():
         if device_config.get("name") in to_be_ignored:
             _LOGGER.warning("Ignoring '%s'", device_config.get("name"))
             continue
         device_type = device_config.get("type")
-        if device_type in known_devices_list:
-            device_obj = known_devices_list.get(device_type)(
+        if (device_class := known_devices.get(device_type)) is not None:
+            device_obj = device_class(
                 device_config,
                 cmdline_args,
             )
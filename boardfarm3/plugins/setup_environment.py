@@ -24,18 +24,16 @@ def _is_async_hook_supported(hook_name: str, device_manager: DeviceManager) -> b
     # we can run asyncio if and only if all devices have both async and blocking
     # hook implementations
     async_hook_name = f"{hook_name}_async"
-    # set of devices with blocking implementation:
-    bio_set = {
-        device
-        for device in device_manager.get_devices_by_type(BoardfarmDevice).values()
-        if hasattr(device, hook_name)
-    }
-    # set of devices with non-blocking implementation:
-    aio_set = {
-        device
-        for device in device_manager.get_devices_by_type(BoardfarmDevice).values()
-        if hasattr(device, async_hook_name)
-    }
+    # set of devices with blocking and non-blocking implementation, hooks are
+    # looked up on the device class to skip the instance attribute lookup
+    bio_set: set[BoardfarmDevice] = set()
+    aio_set: set[BoardfarmDevice] = set()
+    for device in device_manager.get_devices_by_type(BoardfarmDevice).values():
+        device_class = type(device)
+        if hasattr(device_class, hook_name):
+            bio_set.add(device)
+        if hasattr(device_class, async_hook_name):
+            aio_set.add(device)
     if aio_set == bio_set:
         return True
     # inform the user about the devices that are missing the asyncio implementation
@@ -140,7 +140,7 @@ def is_ntp_synchronized(board: CPE) -> bool:
     :rtype: bool
     """
     ntp_output = board.sw.get_ntp_sync_status()
-    if len(ntp_output) == 0:
+    if not ntp_output:
         msg = "No NTP server available to the device"
         raise ValueError(msg)
     if len(ntp_output) > _TOO_MANY_NTPS:
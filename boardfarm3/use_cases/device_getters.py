@@ -1,5 +1,6 @@
 """Device getters use cases."""
 
+from itertools import islice
 from typing import TypeVar
 
 from boardfarm3.exceptions import DeviceNotFound
@@ -25,7 +26,7 @@ def get_lan_clients(count: int) -> list[LAN]:
     if not 0 < count <= len(lan_devices):
         msg = f"Invalid count provided. Only {len(lan_devices)} LAN clients available"
         raise DeviceNotFound(msg)
-    return list(lan_devices.values())[:count]
+    return list(islice(lan_devices.values(), count))
 
 
 def get_wan_clients(count: int) -> list[WAN]:
@@ -43,7 +44,7 @@ def get_wan_clients(count: int) -> list[WAN]:
     if not 0 < count <= len(wan_devices):
         msg = f"Invalid count provided. Only {len(wan_devices)} WAN clients available"
         raise DeviceNotFound(msg)
-    return list(wan_devices.values())[:count]
+    return list(islice(wan_devices.values(), count))
 
 
 def device_getter(device_type: type[T]) -> T:
@@ -24,6 +24,9 @@ if TYPE_CHECKING:
 
 RecursiveDict = dict[str, Any]
 
+# deletes the console line breaks from the tshark JSON output
+_LINE_BREAKS_TABLE = str.maketrans("", "", "\r\n")
+
 
 @dataclass
 class DHCPTraceData:
@@ -74,11 +77,12 @@ def parse_dhcp_trace(
     try:
         out = on_which_device.tshark_read_pcap(
             fname=fname,
-            additional_args="-Y bootp -T json",
+            # -J limits the JSON output to the layers parsed below
+            additional_args="-Y bootp -T json -J 'ip bootp dhcp'",
             timeout=timeout,
         )
         output: list[DHCPTraceData] = []
-        data = "[" + out.split("[", 1)[-1].replace("\r\n", "")
+        data = "[" + out.split("[", 1)[-1].translate(_LINE_BREAKS_TABLE)
 
         # replacing bootp to dhcp as the devices still use older tshark versions
         replaced_data = data.replace("bootp", "dhcp")
@@ -458,9 +462,11 @@ def parse_dhcpv6_trace(
     key_list: list[str] = []
     val_list: list[str | dict] = []
     out = on_which_device.tshark_read_pcap(
-        fname=fname, additional_args=f"-Y '{additional_args}' -T json", timeout=timeout
+        fname=fname,
+        additional_args=f"-Y '{additional_args}' -T json -J 'ipv6 dhcpv6'",
+        timeout=timeout,
     )
-    data = "[" + out.split("[", 1)[-1].replace("\r\n", "")
+    data = "[" + out.split("[", 1)[-1].translate(_LINE_BREAKS_TABLE)
     try:
         obj = JSONDecoder(
             object_pairs_hook=_manage_duplicates,  # type: ignore [arg-type]
@@ -16,7 +16,12 @@ from typing import TYPE_CHECKING, TypeAlias
 import pandas as pd
 
 from boardfarm3.exceptions import MulticastError, UseCaseFailure
-from boardfarm3.lib.multicast import IPerfResult, IPerfSession, IPerfStream
+from boardfarm3.lib.multicast import (
+    IPerfResult,
+    IPerfSession,
+    IPerfStream,
+    read_and_remove_iperf_output,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -329,10 +334,7 @@ def leave_iperf_multicast_group(session: IPerfSession) -> IPerfResult:
 
     # kill -15 iperf session
     dev.console.execute_command(f"kill -15 {session.pid}")
-    out = dev.console.execute_command(f"cat {session.output_file}")
-
-    # remove the file after reading results
-    dev.console.execute_command(f"rm {session.output_file}")
+    out = read_and_remove_iperf_output(dev.console, session.output_file)
     if not out.strip():
         return IPerfResult(None)
 
@@ -447,22 +449,36 @@ def wait_for_multicast_stream_to_end(stream_list: list[IPerfStream]) -> None:
     # This is not asyncio, no high expectations
     sleep(max_time_to_wait)
 
+    # try twice before raising exception.
+    running_streams = stream_list
+    for _ in range(2):
+        # iperf processes of every device running one of the streams
+        iperf_processes: dict[IperfDevice, list[str]] = {}
+        for stream in running_streams:
+            if stream.device not in iperf_processes:
+                iperf_processes[stream.device] = stream.device.console.execute_command(
+                    "pgrep iperf -a"
+                ).splitlines()
+        running_streams = [
+            stream
+            for stream in running_streams
+            if any(
+                str(stream.port) in process and stream.address in process
+                for process in iperf_processes[stream.device]
+            )
+        ]
+        if not running_streams:
+            break
+        sleep(1)
+
     failed_sessions = []
+    for stream in running_streams:
+        stream.device.console.execute_command(f"kill -9 {stream.pid}")
+        failed_sessions.append(
+            f"{stream.address}:{stream.port} did not exit within {stream.time}s"
+        )
     for stream in stream_list:
-        # try twice before raising exception.
-        dev = stream.device
-        for _ in range(2):
-            if not dev.console.execute_command(
-                f"pgrep iperf -a | grep {stream.port}| grep {stream.address}"
-            ):
-                break
-            sleep(1)
-        else:
-            dev.console.execute_command(f"kill -9 {stream.pid}")
-            failed_sessions.append(
-                f"{stream.address}:{stream.port} did not exit within {stream.time}s"
-            )
-        dev.console.execute_command(f"rm {stream.output_file}")
+        stream.device.console.execute_command(f"rm {stream.output_file}")
 
     if failed_sessions:
         raise UseCaseFailure("Following sessions failed:\n".join(failed_sessions))
@@ -32,6 +32,16 @@ if TYPE_CHECKING:
 
 
 _LOGGER = logging.getLogger(__name__)
+_ICMP_VERIFIED_MSG = colored(
+    "Verified ICMP packet:\t%s\t-->>\t%s\tType: %s", color="green"
+)
+_ICMP_NOT_VERIFIED_MSG = colored(
+    "Couldn't verify ICMP packet:\t%s\t-->>\t%s\tType: %s", color="red"
+)
+_ARP_ENTRY_PATTERN = re.compile(
+    r"(?P<address>\d+.\d+.\d+.\d+)\s+(?P<hw_type>\S+)\s+"
+    r"(?P<hw_address>\S+)\s+(?P<flags_mask>\S+)\s+(?P<iface>\S+)"
+)
 
 DeviceWithFwType: TypeAlias = LAN | WAN | ACS | CPE
 SSHDeviceType: TypeAlias = LAN | WAN | WLAN
@@ -199,24 +209,19 @@ def is_icmp_packet_present(
             if captured_sequence[i] == icmp_packet_expected:
                 last_check = i
                 _LOGGER.info(
-                    colored(
-                        f"Verified ICMP packet:\t{icmp_packet_expected.source}\t"
-                        f"-->>\t{icmp_packet_expected.destination}\tType:"
-                        f" {icmp_packet_expected.query_code}",
-                        color="green",
-                    ),
+                    _ICMP_VERIFIED_MSG,
+                    icmp_packet_expected.source,
+                    icmp_packet_expected.destination,
+                    icmp_packet_expected.query_code,
                 )
                 final_result.append(True)
                 break
         else:
             _LOGGER.info(
-                colored(
-                    "Couldn't verify ICMP packet:\t"
-                    f"{icmp_packet_expected.source}\t-->>\t"
-                    f"{icmp_packet_expected.destination}\tType:"
-                    f" {icmp_packet_expected.query_code}",
-                    color="red",
-                ),
+                _ICMP_NOT_VERIFIED_MSG,
+                icmp_packet_expected.source,
+                icmp_packet_expected.destination,
+                icmp_packet_expected.query_code,
             )
             final_result.append(False)
     return all(final_result)
@@ -1006,17 +1011,12 @@ def get_arp_table_info(device: LAN) -> list[dict[str, str]]:
     :return: list of parsed ARP table entries
     :rtype: list[dict[str, str]]
     """
-    arp_table: list[dict[str, str]] = []
     out = device.get_arp_table()
-    arp_regex = re.compile(
-        r"(?P<address>\d+.\d+.\d+.\d+)\s+(?P<hw_type>\S+)\s+"
-        r"(?P<hw_address>\S+)\s+(?P<flags_mask>\S+)\s+(?P<iface>\S+)"
-    )
-    for entry in out.splitlines()[1:]:
-        arp_entry = re.search(arp_regex, entry)
-        if arp_entry:
-            arp_table.append(arp_entry.groupdict())
-    return arp_table
+    return [
+        arp_entry.groupdict()
+        for arp_entry in map(_ARP_ENTRY_PATTERN.search, out.splitlines()[1:])
+        if arp_entry
+    ]
 
 
 def delete_arp_table_entry(device: LAN, ip: str, intf: str) -> None:
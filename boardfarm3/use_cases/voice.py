@@ -20,6 +20,7 @@ from boardfarm3.templates.sip_phone import SIPPhone
 from boardfarm3.templates.sip_server import SIPServer
 
 _LOGGER = logging.getLogger(__name__)
+_ONHOOK_FAILED_MSG = colored("Cannot put phone onhook", color="yellow")
 
 # TODO: confirm that FXS is a SIP Phone
 VoiceClient = SIPPhone
@@ -246,7 +247,7 @@ def shutdown_phone(target_phone: VoiceClient) -> None:
     try:
         dev.on_hook()
     except Exception:  # pylint: disable=broad-except  # noqa: BLE001  # BOARDFARM-4982
-        _LOGGER.warning(colored("Cannot put phone onhook", color="yellow"))
+        _LOGGER.warning(_ONHOOK_FAILED_MSG)
     dev.phone_kill()
 
 
@@ -117,6 +117,33 @@ def test_get_device_config_invalid_device() -> None:
         bf_config.get_device_config("XXX")
 
 
+def test_get_device_config_duplicate_device_name() -> None:
+    """Ensure that the first matching device config is returned on duplicate names."""
+    first_config = {"name": "lan", "type": "bf_lan", "ipaddr": "10.0.0.1"}
+    second_config = {"name": "lan", "type": "bf_lan", "ipaddr": "10.0.0.2"}
+    bf_config = BoardfarmConfig(
+        [first_config, second_config],
+        _VALID_ENV_CONFIG,
+        _VALID_INVENTORY_CONFIG,
+    )
+
+    assert bf_config.get_device_config("lan") is first_config
+
+
+def test_get_device_config_added_device() -> None:
+    """Ensure that a device added to the devices config can be looked up."""
+    bf_config = BoardfarmConfig(
+        list(_MERGED_DEVICE_CONFIG),
+        _VALID_ENV_CONFIG,
+        _VALID_INVENTORY_CONFIG,
+    )
+    bf_config.get_device_config("board")
+    device_config = {"name": "XXX", "type": "bf_lan"}
+    bf_config.get_devices_config().append(device_config)
+
+    assert bf_config.get_device_config("XXX") is device_config
+
+
 def test_get_board_sku_value_available_in_env_conf() -> None:
     """Ensure that the board SKU value can be extracted from the configuration if it is present."""
     bf_config = BoardfarmConfig(
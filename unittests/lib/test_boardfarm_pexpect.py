@@ -129,3 +129,15 @@ def test_write_in_log_wrapper(input_line: str, expected_output: str) -> None:
     stream.seek(0)
     captured_logs = stream.read()
     assert captured_logs == expected_output
+
+
+def test_write_in_log_wrapper_debug_disabled() -> None:
+    """Ensure that nothing is logged when the console logger is not at debug level."""
+    logger = logging.getLogger("test_write_in_log_wrapper_debug_disabled")
+    stream = StringIO()
+    logger.addHandler(logging.StreamHandler(stream))
+    logger.setLevel(logging.INFO)
+    log_wrapper = _LogWrapper(logger)
+    log_wrapper.write("Sample \x1b[32mText\x1b[0m\r\n")
+    stream.seek(0)
+    assert not stream.read()
@@ -181,6 +181,45 @@ def test_tcpdump_pcap_read_with_opts() -> None:
     assert "listening on eth0" in output
 
 
+@pytest.mark.parametrize(
+    ("protocol", "opts", "expected_filter"),
+    [
+        ("udp", "", "udp"),
+        ("", "port 53", "port 53"),
+        ("udp", "port 53", "udp and port 53"),
+    ],
+)
+def test_tcpdump_pcap_read_filter(
+    protocol: str,
+    opts: str,
+    expected_filter: str,
+) -> None:
+    """Test tcpdump read filter has no dangling "and" when a part is empty.
+
+    :param protocol: protocol to filter
+    :type protocol: str
+    :param opts: additional filter expression
+    :type opts: str
+    :param expected_filter: expected filter after the capture file
+    :type expected_filter: str
+    """
+    commands: list[str] = []
+
+    class RecordingLinuxConsole(MyLinuxConsole):
+        def execute_command(self, command: str, timeout: int = -1) -> str:
+            commands.append(command)
+            return super().execute_command(command, timeout)
+
+    tcpdump_read(
+        console=RecordingLinuxConsole(_TCPDUMP_OUTPUT.read_text()),
+        capture_file=_TCPDUMP_OUTPUT.name,
+        protocol=protocol,
+        opts=opts,
+        rm_pcap=False,
+    )
+    assert commands == [f"tcpdump -n -r {_TCPDUMP_OUTPUT.name} {expected_filter}"]
+
+
 def test_scp_conn_error_raises() -> None:
     """Test scp operations."""
     username = "scp_test"
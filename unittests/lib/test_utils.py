@@ -150,6 +150,9 @@ def test_retry_valid_string_bool_false_output(mocker: MockerFixture) -> None:
             "5v",
         ),
         (3, {1: "mercury", 2: "venus"}, None),
+        ("moon", {"earth": {"moon": "luna"}, "moon": "phobos"}, "luna"),
+        ("moon", {"earth": {"moon": None}, "moon": "phobos"}, "phobos"),
+        ("moon", {"sun": {"earth": {"mars": {"moon": "deimos"}}}}, "deimos"),
     ],
 )
 def test_get_value_from_dict_returns_string_dict_none_values(
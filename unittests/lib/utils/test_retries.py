@@ -187,3 +187,49 @@ def test_retries_on_exception(
         )
     assert spy.call_count == exp_count
     assert spy.spy_return is None
+
+
+def test_retry_on_exception_with_max_tout(
+    mocker: MockerFixture,
+    helper_methods: HelperMethods,
+) -> None:
+    """Ensure that the sleep time doubles after every exception up to max_tout.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    :param helper_methods: HelperMethods class instance
+    :type helper_methods: HelperMethods
+    """
+    sleep = mocker.patch("time.sleep")
+    spy = mocker.spy(helper_methods, "raise_exception")
+
+    with pytest.raises(NotImplementedError):
+        retry_on_exception(
+            helper_methods.raise_exception, [], retries=8, tout=1, max_tout=8
+        )
+    assert spy.call_count == 8
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 4, 8, 8, 8, 8]
+
+
+def test_retry_on_exception_with_max_tout_that_goes_away(
+    mocker: MockerFixture,
+    helper_methods: HelperMethods,
+) -> None:
+    """Ensure that the retry with max_tout stops as soon as the method succeeds.
+
+    :param mocker: pytest mock object
+    :type mocker: MockerFixture
+    :param helper_methods: HelperMethods class instance
+    :type helper_methods: HelperMethods
+    """
+    sleep = mocker.patch("time.sleep")
+    spy = mocker.spy(helper_methods, "raise_exception_two_times")
+
+    assert (
+        retry_on_exception(
+            helper_methods.raise_exception_two_times, [[0]], tout=1, max_tout=8
+        )
+        == 2
+    )
+    assert spy.call_count == 2
+    sleep.assert_called_once_with(1)